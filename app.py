@@ -5,30 +5,91 @@ Streamlit App for Event Extraction
 
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date, time
 import calendar as cal
+from itertools import groupby
+from operator import itemgetter
 import uuid
+import os
+import re
+import html
 from nlp_utils import (
-    load_ner_model,
+    preload_ner_model,
     normalize_thai_text,
     extract_slots,
-    extract_multiple_events,
+    iter_multiple_events,
     create_event,
-    load_events,
-    save_events,
-    add_event,
-    delete_event,
-    update_event,
+    connect_events_db,
+    db_load_events,
+    fetch_events_for_month,
+    db_add_event,
+    db_add_events,
+    db_delete_event,
+    db_update_event,
+    db_clear_events,
+    db_get_event,
+    dump_events_json,
     get_current_datetime,
     process_text_to_event
 )
+from validation import (
+    validate_and_fill,
+    format_missing_fields_message,
+    is_event_saveable
+)
+
+# Stored event date/time formats (compiled once instead of strptime per call)
+_DATE_RE = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$')
+_TIME_RE = re.compile(r'^(\d{1,2}):(\d{2})$')
+
+
+def parse_date_value(value):
+    """Parse a stored 'YYYY-MM-DD' string into a date (None if invalid)"""
+    match = _DATE_RE.match(value or '')
+    if not match:
+        return None
+    try:
+        return date(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+
+def parse_time_value(value):
+    """Parse a stored 'HH:MM' string into a time (None if invalid)"""
+    match = _TIME_RE.match(value or '')
+    if not match:
+        return None
+    try:
+        return time(*map(int, match.groups()))
+    except ValueError:
+        return None
+
+
+# Calendar grid and day cell templates with all styling baked in
+CALENDAR_GRID = '<div class="calendar-grid">{cells}</div>'
+DAY_HEADER_CELL = '<div class="calendar-day-header">{name}</div>'
+EMPTY_CELL = '<div class="calendar-day" style="background-color: #f7fafc; min-height: 120px;"></div>'
+TODAY_CELL = (
+    '<div class="calendar-day" style="background-color: #fef3c7;">'
+    '<div class="day-number">{day}<span class="today-badge">TODAY</span></div>'
+    '{chips}</div>'
+)
+NORMAL_CELL = (
+    '<div class="calendar-day" style="background-color: white;">'
+    '<div class="day-number">{day}</div>'
+    '{chips}</div>'
+)
+EVENT_CHIP = '<div class="event-chip">{label}</div>'
+
 
 # Generate unique session ID for this user
 if 'session_id' not in st.session_state:
     st.session_state.session_id = str(uuid.uuid4().hex[:12])
 
-# Session-specific events file
-SESSION_EVENTS_FILE = f"events_{st.session_state.session_id}.json"
+# Session-specific events database (connection reused across reruns)
+SESSION_EVENTS_DB = f"events_{st.session_state.session_id}.db"
+if 'db_conn' not in st.session_state:
+    st.session_state.db_conn = connect_events_db(SESSION_EVENTS_DB)
 
 # Page configuration
 st.set_page_config(
@@ -42,12 +103,14 @@ st.set_page_config(
 if 'messages' not in st.session_state:
     st.session_state.messages = []
 
-if 'nlp_model' not in st.session_state:
-    with st.spinner('Loading NLP model...'):
-        st.session_state.nlp_model = load_ner_model()
+# Load the NLP model in the background so the page can render meanwhile
+if 'nlp_future' not in st.session_state:
+    st.session_state.nlp_future = preload_ner_model()
+
+# Current time, read once per rerun and reused below
+now = get_current_datetime()
 
 if 'current_month' not in st.session_state:
-    now = get_current_datetime()
     st.session_state.current_month = now.month
     st.session_state.current_year = now.year
 
@@ -63,91 +126,138 @@ if 'editing_event_id' not in st.session_state:
 if 'editing_in_modal' not in st.session_state:
     st.session_state.editing_in_modal = None
 
+if 'events_cache' not in st.session_state:
+    st.session_state.events_cache = {}
+
+def get_cached_events(year=None, month=None):
+    """
+    Return session events, querying the database only after a change
+    
+    With year/month, returns only that month's events; otherwise all events.
+    """
+    cache = st.session_state.events_cache
+    key = (year, month)
+    if key not in cache:
+        if year is None:
+            cache[key] = db_load_events(st.session_state.db_conn)
+        else:
+            cache[key] = fetch_events_for_month(st.session_state.db_conn, year, month)
+    return cache[key]
+
+
+def get_cached_events_by_date(year, month):
+    """Return the given month's events grouped by date, cached like get_cached_events"""
+    cache = st.session_state.events_cache
+    key = ('by_date', year, month)
+    if key not in cache:
+        # Month events arrive sorted by date, so each day is one contiguous run
+        cache[key] = {
+            date_str: list(day_events)
+            for date_str, day_events in groupby(get_cached_events(year, month), key=itemgetter('date'))
+        }
+    return cache[key]
+
+
+def event_chip(label):
+    """HTML chip showing an event inside a calendar day cell"""
+    return EVENT_CHIP.format(label=html.escape(label))
+
+
+def open_picked_event():
+    """Open the event chosen in the calendar's event picker, then clear the picker"""
+    event_id = st.session_state.event_picker
+    if event_id:
+        st.session_state.selected_event = db_get_event(st.session_state.db_conn, event_id)
+        st.session_state.editing_in_modal = None
+    st.session_state.event_picker = None
+
+
+def get_nlp_model():
+    """Return the NLP model, waiting for the background load if needed"""
+    future = st.session_state.nlp_future
+    if not future.done():
+        with st.spinner('Loading NLP model...'):
+            return future.result()
+    return future.result()
+
+
+def invalidate_events_cache():
+    """Drop cached events after any add/update/delete"""
+    st.session_state.events_cache = {}
+
 # Custom CSS - with larger sidebar and modern calendar design
-st.markdown("""
-<style>
-    /* Larger sidebar text */
-    [data-testid="stSidebar"] {
-        font-size: 1.1rem;
-    }
-    [data-testid="stSidebar"] .stButton button {
-        font-size: 1.1rem;
-    }
-    [data-testid="stSidebar"] h2, [data-testid="stSidebar"] h3 {
-        font-size: 1.4rem;
-    }
+@st.cache_resource
+def load_css():
+    """Read the stylesheet once per server process"""
+    with open(os.path.join(os.path.dirname(__file__), 'static', 'app.css'), encoding='utf-8') as f:
+        return f.read()
+
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+@st.fragment
+def render_event_list():
+    """
+    Sidebar event list
     
-    .stChatMessage {
-        padding: 1rem;
-        border-radius: 0.5rem;
-    }
-    .event-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 1rem;
-        margin: 0.5rem 0;
-        border-left: 4px solid #5a67d8;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    .event-card h4 {
-        color: white !important;
-        margin-bottom: 1rem;
-    }
-    .event-card p strong {
-        color: #ffd700;
-    }
+    Runs as a fragment so selecting a row only reruns this list,
+    and renders one table instead of an expander + buttons per event.
+    """
+    events = get_cached_events()
     
-    /* Modern Calendar Styling */
-    .calendar-container {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 1rem;
-        box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-    }
-    .calendar-day {
-        border: 1px solid #e2e8f0;
-        padding: 0.75rem;
-        min-height: 120px;
-        background: white;
-        border-radius: 0.5rem;
-        margin: 2px;
-        transition: all 0.2s;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-    }
-    .calendar-day:hover {
-        box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-        transform: translateY(-2px);
-    }
-    .calendar-day-header {
-        font-weight: 700;
-        text-align: center;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 0.75rem;
-        font-size: 1.1rem;
-        border-radius: 0.5rem;
-        margin: 2px;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-    .day-number {
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: #2d3748;
-        margin-bottom: 0.5rem;
-    }
-    .today-badge {
-        background: #fbbf24;
-        color: #78350f;
-        padding: 2px 8px;
-        border-radius: 12px;
-        font-size: 0.7rem;
-        font-weight: 700;
-        margin-left: 4px;
-    }
-</style>
-""", unsafe_allow_html=True)
+    if not events:
+        st.info("No events yet. Start chatting to add events!")
+        return
+    
+    total_text = f"Total: {len(events)} events"
+    st.markdown(f"**{total_text}**")
+    
+    # Events come back from the database already sorted by date
+    table = pd.DataFrame([
+        {
+            'Date': event.get('date') or 'No date',
+            'Time': event.get('time') or '',
+            'Event': event.get('description') or 'No description',
+        }
+        for event in events
+    ])
+    selection = st.dataframe(
+        table,
+        on_select="rerun",
+        selection_mode="single-row",
+        hide_index=True,
+        width="stretch"
+    )
+    
+    selected_rows = selection.selection.rows
+    if not selected_rows:
+        st.caption("Select an event to view or delete it")
+        return
+    
+    event = events[selected_rows[0]]
+    
+    # Show details of the selected event
+    st.markdown(f"**Time:** {event.get('time') or ''}")
+    st.markdown(f"**Event:** {event.get('description') or 'No description'}")
+    if event.get('attendees') and event.get('attendees') != '-':
+        st.markdown(f"**Attendees:** {event.get('attendees')}")
+    if event.get('location') and event.get('location') != '-':
+        st.markdown(f"**Location:** {event.get('location')}")
+    
+    # Buttons to view full details or delete
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("🔍 View", key=f"view_{event['id']}", use_container_width=True):
+            st.session_state.selected_event = event
+            st.session_state.editing_in_modal = None  # Reset edit mode
+            st.rerun()
+    with col2:
+        if st.button("🗑️ Delete", key=f"del_{event['id']}", use_container_width=True, type="secondary"):
+            db_delete_event(st.session_state.db_conn, event['id'])
+            invalidate_events_cache()
+            st.success("Event deleted!")
+            st.rerun()
+
 
 # Sidebar
 with st.sidebar:
@@ -156,95 +266,65 @@ with st.sidebar:
     
     # Calendar navigation
     st.subheader("Calendar Navigation")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("◀"):
-            st.session_state.current_month -= 1
-            if st.session_state.current_month < 1:
-                st.session_state.current_month = 12
-                st.session_state.current_year -= 1
-            st.rerun()
+    with st.form("nav_form", border=False):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            prev_clicked = st.form_submit_button("◀")
+        
+        with col2:
+            month_year = f"{cal.month_name[st.session_state.current_month]} {st.session_state.current_year}"
+            st.markdown(f"**{month_year}**")
+        
+        with col3:
+            next_clicked = st.form_submit_button("▶")
+        
+        # Today button
+        today_clicked = st.form_submit_button("📍 Today")
     
-    with col2:
-        month_year = f"{cal.month_name[st.session_state.current_month]} {st.session_state.current_year}"
-        st.markdown(f"**{month_year}**")
+    if prev_clicked:
+        st.session_state.current_month -= 1
+        if st.session_state.current_month < 1:
+            st.session_state.current_month = 12
+            st.session_state.current_year -= 1
+        st.rerun()
     
-    with col3:
-        if st.button("▶"):
-            st.session_state.current_month += 1
-            if st.session_state.current_month > 12:
-                st.session_state.current_month = 1
-                st.session_state.current_year += 1
-            st.rerun()
+    if next_clicked:
+        st.session_state.current_month += 1
+        if st.session_state.current_month > 12:
+            st.session_state.current_month = 1
+            st.session_state.current_year += 1
+        st.rerun()
     
-    # Today button
-    if st.button("📍 Today"):
-        now = get_current_datetime()
+    if today_clicked:
         st.session_state.current_month = now.month
         st.session_state.current_year = now.year
         st.rerun()
     
     st.markdown("---")
     
-    # All events list - Each event collapsible
+    # All events list - one selectable table
     st.subheader("📋 All Events")
-    events = load_events(SESSION_EVENTS_FILE)
-    
-    if events:
-        total_text = f"Total: {len(events)} events"
-        st.markdown(f"**{total_text}**")
-        st.markdown("---")
-        
-        
-        for idx, event in enumerate(sorted(events, key=lambda x: x.get('date') or '9999-99-99')):
-            desc = event.get('description') or 'No description'
-            event_date = event.get('date', 'No date')
-            event_time = event.get('time', '')
-            
-            # Each event in its own expander
-            with st.expander(f"📅 {event_date} - {desc[:25]}...", expanded=False):
-                # Show details inside the expander
-                st.markdown(f"**Time:** {event_time}")
-                st.markdown(f"**Event:** {desc}")
-                if event.get('attendees') and event.get('attendees') != '-':
-                    st.markdown(f"**Attendees:** {event.get('attendees')}")
-                if event.get('location') and event.get('location') != '-':
-                    st.markdown(f"**Location:** {event.get('location')}")
-                
-            st.markdown("---")
-            
-            # Buttons to view full details or delete
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("🔍 View", key=f"view_{idx}_{event['id']}", use_container_width=True):
-                    st.session_state.selected_event = event
-                    st.session_state.editing_in_modal = None  # Reset edit mode
-                    st.rerun()
-            with col2:
-                if st.button("🗑️ Delete", key=f"del_{idx}_{event['id']}", use_container_width=True, type="secondary"):
-                    delete_event(event['id'], SESSION_EVENTS_FILE)
-                    st.success("Event deleted!")
-                    st.rerun()
-    else:
-        st.info("No events yet. Start chatting to add events!")
+    render_event_list()
     
     st.markdown("---")
     
     # Export options
     st.subheader("Export")
-    if st.button("📥 Export as JSON"):
-        st.download_button(
-            label="Download events.json",
-            data=open(SESSION_EVENTS_FILE, 'r', encoding='utf-8').read(),
-            file_name='events.json',
-            mime='application/json'
-        )
+    # Serialized only when clicked (the callable runs off the script thread)
+    export_events = get_cached_events()
+    st.download_button(
+        label="📥 Export as JSON",
+        data=lambda: dump_events_json(export_events),
+        file_name='events.json',
+        mime='application/json'
+    )
     
     # Clear data
     if st.button("🗑️ Clear All Data"):
         if st.checkbox("Confirm delete all"):
-            save_events([], SESSION_EVENTS_FILE)
+            db_clear_events(st.session_state.db_conn)
+            invalidate_events_cache()
             st.session_state.messages = []
             st.success("All data cleared!")
             st.rerun()
@@ -280,6 +360,8 @@ with tab1:
                 """, unsafe_allow_html=True)
     
     # Chat input
+    if not st.session_state.nlp_future.done():
+        st.caption("⏳ Loading NLP model...")
     if prompt := st.chat_input("พิมพ์ข้อความภาษาไทย... (เช่น พรุ่งนี้มีประชุมกับบีมตอน 10 โมง)"):
         # Add user message
         st.session_state.messages.append({"role": "user", "content": prompt})
@@ -291,21 +373,24 @@ with tab1:
         with st.chat_message("assistant"):
             with st.spinner("Processing..."):
                 try:
-                    # Extract MULTIPLE events using new separator logic
-                    events = extract_multiple_events(
-                        prompt,
-                        nlp_model=st.session_state.nlp_model
-                    )
+                    # Reset pending_events for new input (prevents duplicates)
+                    st.session_state.pending_events = []
                     
-                    # Process each event - validate and create
-                    from validation import validate_event_data, apply_safe_defaults
-                    valid_events = []
-                    for slots in events:
-                        # Validate and get safe defaults
-                        is_valid, missing_fields, safe_defaults = validate_event_data(slots)
+                    # Filled in once we know whether there are multiple events
+                    summary_placeholder = st.empty()
+                    first_heading = None
+                    event_count = 0
+                    
+                    # Extract MULTIPLE events using new separator logic,
+                    # displaying each one as soon as it has been parsed
+                    for idx, slots in enumerate(iter_multiple_events(
+                        prompt,
+                        nlp_model=get_nlp_model()
+                    ), 1):
+                        event_count = idx
                         
-                        # Apply safe defaults
-                        slots_with_defaults = apply_safe_defaults(slots, safe_defaults)
+                        # Validate and apply safe defaults
+                        is_valid, missing_fields, safe_defaults, slots_with_defaults = validate_and_fill(slots)
                         
                         # Create event (without saving)
                         event = create_event(slots_with_defaults)
@@ -313,20 +398,11 @@ with tab1:
                         # Add validation metadata
                         event['is_valid'] = is_valid
                         event['missing_fields'] = missing_fields
-                        event['auto_filled'] = safe_defaults
+                        event['auto_filled'] = dict(safe_defaults)  # Plain dict, not the shared read-only defaults
                         
-                        valid_events.append(event)
-                    
-                    # Check if we have multiple events
-                    if len(valid_events) > 1:
-                        st.success(f"✨ พบ {len(valid_events)} กิจกรรม!")
-                    
-                    # Display each event
-                    for idx, event in enumerate(valid_events, 1):
                         # Check validation status
                         if not event.get('is_valid'):
                             # CRITICAL DATA MISSING - Ask user
-                            from validation import format_missing_fields_message
                             missing_msg = format_missing_fields_message(event.get('missing_fields', []))
                             
                             st.warning(f"⚠️ กิจกรรมที่ {idx}: ข้อมูลไม่ครบ")
@@ -339,11 +415,12 @@ with tab1:
                         
                         else:
                             # DATA IS VALID - Show confirmation UI
-                            if len(valid_events) > 1:
+                            if idx > 1:
                                 response = f"✅ กิจกรรมที่ {idx}:"
                             else:
                                 response = "✅ ฉันพบข้อมูลนี้จากข้อความของคุณ:"
-                            st.markdown(response)
+                            heading = st.empty()
+                            heading.markdown(response)
                         
                             # Show auto-filled info if any
                             if event.get('auto_filled'):
@@ -367,17 +444,27 @@ with tab1:
                             </div>
                             """, unsafe_allow_html=True)
                             
-                            #Store pending event(s) in session state
-                            # Reset pending_events for new input (prevents duplicates)
-                            st.session_state.pending_events = []
+                            # Store pending event(s) in session state
                             st.session_state.pending_events.append(event)
                             
-                            st.session_state.messages.append({
+                            message = {
                                 "role": "assistant",
                                 "content": response,
                                 "event": event,
                                 "needs_confirmation": True
-                            })
+                            }
+                            st.session_state.messages.append(message)
+                            if idx == 1:
+                                first_heading = (heading, message)
+                    
+                    # Check if we have multiple events
+                    if event_count > 1:
+                        summary_placeholder.success(f"✨ พบ {event_count} กิจกรรม!")
+                        # The first event was shown before we knew there were more
+                        if first_heading:
+                            heading, message = first_heading
+                            message["content"] = "✅ กิจกรรมที่ 1:"
+                            heading.markdown(message["content"])
                     
                 except Exception as e:
                     error_msg = f"เกิดข้อผิดพลาด: {str(e)}"
@@ -398,103 +485,100 @@ with tab1:
         else:
             st.subheader("🔍 ยืนยันการบันทึก")
         
-        col1, col2, col3 = st.columns([1, 1, 2])
-        
-        with col1:
-            if st.button("✅ บันทึกทั้งหมด", key="confirm_save_all_btn", use_container_width=True, type="primary"):
-                try:
-                    from validation import is_event_saveable
-                    from nlp_utils import add_event
-                    
-                    saved_count = 0
-                    failed_events = []
-                    
-                    # Save all valid events
-                    for idx, pending in enumerate(pending_events, 1):
-                        # CRITICAL: Clean FIRST, then validate (matches edit flow)
-                        clean_event = {k: v for k, v in pending.items() 
-                                     if k not in ['is_valid', 'missing_fields', 'auto_filled']}
+        # One form for the three actions, so nothing reruns until one is submitted
+        with st.form("confirm_form", border=False):
+            col1, col2, col3 = st.columns([1, 1, 2])
+            
+            with col1:
+                if st.form_submit_button("✅ บันทึกทั้งหมด", key="confirm_save_all_btn", width="stretch", type="primary"):
+                    try:
+                        events_to_save = []
+                        failed_events = []
                         
-                        # Replace placeholder "-" with None for validation
-                        for key in ['date', 'time', 'description', 'attendees', 'location']:
-                            if clean_event.get(key) == '-':
-                                clean_event[key] = None
+                        # Collect all valid events
+                        for idx, pending in enumerate(pending_events, 1):
+                            # CRITICAL: Clean FIRST, then validate (matches edit flow)
+                            clean_event = {k: v for k, v in pending.items() 
+                                         if k not in ['is_valid', 'missing_fields', 'auto_filled']}
+                            
+                            # Replace placeholder "-" with None for validation
+                            for key in ['date', 'time', 'description', 'attendees', 'location']:
+                                if clean_event.get(key) == '-':
+                                    clean_event[key] = None
+                            
+                            # Now validate the clean data
+                            if is_event_saveable(clean_event):
+                                events_to_save.append(clean_event)
+                            else:
+                                # Track which fields are missing
+                                missing = []
+                                if not clean_event.get('date'):
+                                    missing.append('วันที่')
+                                if not clean_event.get('time'):
+                                    missing.append('เวลา')
+                                if not clean_event.get('description'):
+                                    missing.append('กิจกรรม')
+                                failed_events.append((idx, missing))
+                        
+                        # Save them all in a single transaction
+                        if events_to_save:
+                            db_add_events(st.session_state.db_conn, events_to_save)
+                            invalidate_events_cache()
+                        saved_count = len(events_to_save)
                         
-                        # Now validate the clean data
-                        if is_event_saveable(clean_event):
-                            add_event(clean_event, SESSION_EVENTS_FILE)
-                            saved_count += 1
+                        # Show detailed results
+                        if saved_count == len(pending_events):
+                            st.success(f"✅ บันทึกสำเร็จ {saved_count} กิจกรรม!")
+                            # Clear all pending states and rerun
+                            st.session_state.pending_events = []
+                            st.session_state.pending_event = None
+                            st.session_state.show_edit_form = False
+                            st.rerun()
+                        elif saved_count > 0:
+                            st.warning(f"⚠️ บันทึกสำเร็จ {saved_count}/{len(pending_events)} กิจกรรม")
+                            for event_num, missing_fields in failed_events:
+                                st.error(f"❌ กิจกรรมที่ {event_num}: ขาด {', '.join(missing_fields)}")
+                            # Partial save - clear only saved events, keep failed ones
+                            st.session_state.pending_events = []
+                            st.session_state.pending_event = None
+                            st.session_state.show_edit_form = False
+                            st.rerun()
                         else:
-                            # Track which fields are missing
-                            missing = []
-                            if not clean_event.get('date'):
-                                missing.append('วันที่')
-                            if not clean_event.get('time'):
-                                missing.append('เวลา')
-                            if not clean_event.get('description'):
-                                missing.append('กิจกรรม')
-                            failed_events.append((idx, missing))
-                    
-                    # Show detailed results
-                    if saved_count == len(pending_events):
-                        st.success(f"✅ บันทึกสำเร็จ {saved_count} กิจกรรม!")
-                        # Clear all pending states and rerun
-                        st.session_state.pending_events = []
-                        st.session_state.pending_event = None
-                        st.session_state.show_edit_form = False
-                        st.rerun()
-                    elif saved_count > 0:
-                        st.warning(f"⚠️ บันทึกสำเร็จ {saved_count}/{len(pending_events)} กิจกรรม")
-                        for event_num, missing_fields in failed_events:
-                            st.error(f"❌ กิจกรรมที่ {event_num}: ขาด {', '.join(missing_fields)}")
-                        # Partial save - clear only saved events, keep failed ones
-                        st.session_state.pending_events = []
-                        st.session_state.pending_event = None
-                        st.session_state.show_edit_form = False
-                        st.rerun()
-                    else:
-                        # No saves - show errors and DON'T rerun (let user see the errors)
-                        st.error("❌ ไม่สามารถบันทึกได้ - ข้อมูลไม่ครบ")
-                        for event_num, missing_fields in failed_events:
-                            st.error(f"📌 กิจกรรมที่ {event_num}: ขาด {', '.join(missing_fields)}")
-                    
-                except Exception as e:
-                    st.error(f"❌ เกิดข้อผิดพลาดในการบันทึก: {str(e)}")
-        
-        
-        
-        with col2:
-            if st.button("✏️ แก้ไข", key="confirm_edit_btn", use_container_width=True):
-                st.session_state.show_edit_form = True
-                st.session_state.pending_event = pending_events[0]  # Edit first event
-        
-        with col3:
-            if st.button("❌ ยกเลิก", key="confirm_cancel_btn", use_container_width=True):
-                st.session_state.pending_events = []
-                st.session_state.pending_event = None
-                st.rerun()
+                            # No saves - show errors and DON'T rerun (let user see the errors)
+                            st.error("❌ ไม่สามารถบันทึกได้ - ข้อมูลไม่ครบ")
+                            for event_num, missing_fields in failed_events:
+                                st.error(f"📌 กิจกรรมที่ {event_num}: ขาด {', '.join(missing_fields)}")
+                        
+                    except Exception as e:
+                        st.error(f"❌ เกิดข้อผิดพลาดในการบันทึก: {str(e)}")
+            
+            
+            
+            with col2:
+                if st.form_submit_button("✏️ แก้ไข", key="confirm_edit_btn", width="stretch"):
+                    st.session_state.show_edit_form = True
+                    st.session_state.pending_event = pending_events[0]  # Edit first event
+            
+            with col3:
+                if st.form_submit_button("❌ ยกเลิก", key="confirm_cancel_btn", width="stretch"):
+                    st.session_state.pending_events = []
+                    st.session_state.pending_event = None
+                    st.rerun()
+            
         
         # Show edit form if requested
         if st.session_state.get('show_edit_form'):
             st.markdown("### ✏️ แก้ไขข้อมูล")
             
             with st.form("edit_event_form"):
-                from datetime import datetime
-                
                 # Get the pending event from session state
                 pending = st.session_state.get('pending_event', {})
                 
                 # Parse date for date_input
-                try:
-                    date_val = datetime.strptime(pending.get('date', ''), '%Y-%m-%d').date() if pending.get('date') else None
-                except:
-                    date_val = None
+                date_val = parse_date_value(pending.get('date'))
                 
                 # Parse time for time_input
-                try:
-                    time_val = datetime.strptime(pending.get('time', '09:00'), '%H:%M').time() if pending.get('time') else None
-                except:
-                    time_val = None
+                time_val = parse_time_value(pending.get('time'))
                 
                 new_date = st.date_input("📅 วันที่", value=date_val)
                 new_time = st.time_input("🕐 เวลา", value=time_val)
@@ -503,8 +587,6 @@ with tab1:
                 new_location = st.text_input("📍 สถานที่", value=pending.get('location', ''))
                 
                 if st.form_submit_button("💾 บันทึกการแก้ไข", use_container_width=True, type="primary"):
-                    from validation import is_event_saveable
-                    
                     # Update pending event with new values
                     updated_event = {
                         'id': pending['id'],
@@ -519,7 +601,8 @@ with tab1:
                     
                     # Final validation
                     if is_event_saveable(updated_event):
-                        add_event(updated_event, SESSION_EVENTS_FILE)  # Save to session file!
+                        db_add_event(st.session_state.db_conn, updated_event)  # Save to session DB!
+                        invalidate_events_cache()
                         st.success("✅ บันทึกการแก้ไขสำเร็จ!")
                         # Clear all pending states
                         st.session_state.pending_events = []
@@ -533,79 +616,71 @@ with tab2:
     # Calendar view
     st.subheader(f"📅 {cal.month_name[st.session_state.current_month]} {st.session_state.current_year}")
     
-    # Load events for display
-    events = load_events(SESSION_EVENTS_FILE)
-    events_by_date = {}
-    for event in events:
-        if event.get('date'):
-            if event['date'] not in events_by_date:
-                events_by_date[event['date']] = []
-            events_by_date[event['date']].append(event)
+    # Visible month's events grouped by date (rebuilt only after a change)
+    events_by_date = get_cached_events_by_date(st.session_state.current_year, st.session_state.current_month)
     
     # Create calendar
     month_cal = cal.monthcalendar(st.session_state.current_year, st.session_state.current_month)
     
+    # Computed once per render instead of once per day cell
+    today_str = now.strftime('%Y-%m-%d')
+    date_prefix = f"{st.session_state.current_year}-{st.session_state.current_month:02d}-"
+    
     # Day headers
-    cols = st.columns(7)
-    day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-    for i, day_name in enumerate(day_names):
-        with cols[i]:
-            st.markdown(f'<div class="calendar-day-header">{day_name}</div>', unsafe_allow_html=True)
+    cells = [DAY_HEADER_CELL.format(name=day_name) for day_name in ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')]
     
     # Calendar days
     for week in month_cal:
-        cols = st.columns(7)
-        for i, day in enumerate(week):
-            with cols[i]:
-                if day == 0:
-                    # Empty day cell
-                    st.markdown('<div class="calendar-day" style="background-color: #f7fafc; min-height: 120px;"></div>', unsafe_allow_html=True)
-                else:
-                    date_str = f"{st.session_state.current_year}-{st.session_state.current_month:02d}-{day:02d}"
-                    
-                    # Check if this is today
-                    now = get_current_datetime()
-                    is_today = (date_str == now.strftime('%Y-%m-%d'))
-                    
-                    # Get events for this day
-                    day_events = events_by_date.get(date_str, [])
-                    
-                    # Build day cell HTML with modern styling
-                    today_badge = '<span class="today-badge">TODAY</span>' if is_today else ''
-                    bg_color = "#fef3c7" if is_today else "white"
-                    
-                    # Start container
-                    st.markdown(
-                        f'<div class="calendar-day" style="background-color: {bg_color};">'
-                        f'<div class="day-number">{day}{today_badge}</div>',
-                        unsafe_allow_html=True
-                    )
-                    
-                    # Limit events shown to prevent overlap (max 2)
-                    MAX_EVENTS_SHOWN = 2
-                    visible_events = day_events[:MAX_EVENTS_SHOWN]
-                    hidden_count = len(day_events) - MAX_EVENTS_SHOWN
-                    
-                    # Create clickable buttons for visible events
-                    for event_idx, event in enumerate(visible_events):
-                        time_str = event.get('time', '')
-                        desc = (event.get('description') or 'Event')[:15]
-                        button_label = f"🔔 {time_str} {desc}"
-                        
-                        if st.button(button_label, key=f"cal_event_{event_idx}_{event['id']}_{date_str}", use_container_width=True, type="secondary"):
-                            st.session_state.selected_event = event
-                            st.rerun()
-                    
-                    # Show "+ X more" button if there are hidden events
-                    if hidden_count > 0:
-                        if st.button(f"+ {hidden_count} more", key=f"more_{date_str}", use_container_width=True, type="secondary"):
-                            # Set first hidden event to show them all somehow
-                            # For now, just show the first hidden one
-                            st.session_state.selected_event = day_events[MAX_EVENTS_SHOWN]
-                            st.rerun()
-                    
-                    # Close div
-                    st.markdown('</div>', unsafe_allow_html=True)
+        for day in week:
+            if day == 0:
+                # Empty day cell
+                cells.append(EMPTY_CELL)
+                continue
+            
+            date_str = f"{date_prefix}{day:02d}"
+            
+            # Get events for this day
+            day_events = events_by_date.get(date_str, [])
+            
+            # Limit events shown to prevent overlap (max 2)
+            MAX_EVENTS_SHOWN = 2
+            visible_events = day_events[:MAX_EVENTS_SHOWN]
+            hidden_count = len(day_events) - MAX_EVENTS_SHOWN
+            
+            # Event chips are plain HTML, not widgets (events open from the picker below)
+            chips_html = ''
+            for event in visible_events:
+                time_str = event.get('time', '')
+                desc = (event.get('description') or 'Event')[:15]
+                chips_html += event_chip(f"🔔 {time_str} {desc}")
+            
+            # Show "+ X more" if there are hidden events
+            if hidden_count > 0:
+                chips_html += event_chip(f"+ {hidden_count} more")
+            
+            cell_template = TODAY_CELL if date_str == today_str else NORMAL_CELL
+            cells.append(cell_template.format(day=day, chips=chips_html))
+    
+    # Whole month grid in a single markdown element
+    st.markdown(CALENDAR_GRID.format(cells=''.join(cells)), unsafe_allow_html=True)
+    
+    # One picker for the whole month opens an event without reloading the page
+    # (a rerun keeps the chat, pending events and any open form)
+    month_events = get_cached_events(st.session_state.current_year, st.session_state.current_month)
+    if month_events:
+        event_labels = {
+            event['id']: f"{event.get('date', '')} {event.get('time') or ''} {event.get('description') or 'Event'}"
+            for event in month_events
+        }
+        st.selectbox(
+            "🔍 เปิดดูกิจกรรม",
+            options=list(event_labels),
+            format_func=event_labels.get,
+            index=None,
+            placeholder="เลือกกิจกรรมในเดือนนี้...",
+            key="event_picker",
+            on_change=open_picked_event,
+        )
 
 # Event Detail Modal - Using st.dialog for floating popup
 @st.dialog("📋 Event Details", width="large")
@@ -618,18 +693,9 @@ def show_event_details():
         st.markdown("### ✏️ แก้ไขข้อมูล")
         
         with st.form(key=f"modal_edit_{event['id']}"):
-            from datetime import datetime
-            
             # Parse existing values
-            try:
-                date_val = datetime.strptime(event.get('date', ''), '%Y-%m-%d').date() if event.get('date') else None
-            except:
-                date_val = None
-            
-            try:
-                time_val = datetime.strptime(event.get('time', '09:00'), '%H:%M').time() if event.get('time') else None
-            except:
-                time_val = None
+            date_val = parse_date_value(event.get('date'))
+            time_val = parse_time_value(event.get('time'))
             
             new_date = st.date_input("📅 วันที่", value=date_val)
             new_time = st.time_input("🕐 เวลา", value=time_val)
@@ -647,7 +713,8 @@ def show_event_details():
                         'attendees': new_attendees if new_attendees else '-',
                         'location': new_location if new_location else '-'
                     }
-                    update_event(event['id'], updated_data, SESSION_EVENTS_FILE)
+                    db_update_event(st.session_state.db_conn, event['id'], updated_data)
+                    invalidate_events_cache()
                     st.session_state.editing_in_modal = None
                     st.session_state.selected_event = None
                     st.success("✅ บันทึกเรียบร้อย!")
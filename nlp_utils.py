@@ -7,23 +7,39 @@ Includes NER, POS validation, slot mapping, and date/time parsing.
 
 import spacy
 import json
+import os
 import re
+import sqlite3
+import threading
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple, Optional
 import pytz
 try:
     from pythainlp import normalize
     import dateparser
 except ImportError:
     print("Warning: pythainlp or dateparser not installed")
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
 
 # Constants
 TZ = pytz.timezone('Asia/Bangkok')
-EVENTS_FILE = "events.json"
+EVENTS_FILE = "events.jsonl"
+LEGACY_EVENTS_FILE = "events.json"
 
 # Global NLP model (loaded once)
 _nlp_model = None
+_model_lock = threading.Lock()
+_model_future = None
+_preload_lock = threading.Lock()
+
+# Pipeline components we never read from (only entities and POS tags are used)
+UNUSED_PIPES = ["parser", "lemmatizer", "attribute_ruler"]
 
 # =========================
 # Normalization Dictionaries (from NLP_PROJECT.ipynb)
@@ -130,6 +146,32 @@ LOANWORD_DICT = {
     "online": "ออนไลน์",
 }
 
+def _compile_alternation(words) -> re.Pattern:
+    """Build one regex matching any of the words, longest first"""
+    return re.compile('|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True)))
+
+
+def _rank(words) -> Dict[str, int]:
+    """Position of each word in its list/dict (lower = higher priority)"""
+    return {word: rank for rank, word in enumerate(words)}
+
+
+def _first_keyword(pattern: re.Pattern, rank: Dict[str, int], text: str) -> Optional[str]:
+    """Highest-priority keyword of `pattern` found in text (one scan), or None"""
+    matches = pattern.findall(text)
+    return min(matches, key=rank.__getitem__) if matches else None
+
+
+# Both dictionaries merged and applied to the (lowercased) text
+_NORMALIZE_MAP = {k.lower(): v for k, v in {**LOANWORD_DICT, **SLANG_DICT}.items()}
+
+# Clock-time keys ("บ่ายสอง" -> "14:00") get their own pass first, so an
+# equally long period key that starts earlier ("ตอนบ่าย" in "ตอนบ่ายสอง")
+# cannot swallow them; the remaining keys share the second pass
+_NORMALIZE_TIME_KEYS = [k for k, v in _NORMALIZE_MAP.items() if re.fullmatch(r'\d{2}:\d{2}', v)]
+_NORMALIZE_TIME_RE = _compile_alternation(_NORMALIZE_TIME_KEYS)
+_NORMALIZE_RE = _compile_alternation(k for k in _NORMALIZE_MAP if k not in _NORMALIZE_TIME_KEYS)
+
 SPLIT_WORD_CORRECTION = {
     ("มหา", "ลับ"): "มหาวิทยาลัย",
     ("มหา", "ลัย"): "มหาวิทยาลัย",
@@ -142,6 +184,152 @@ SPLIT_WORD_CORRECTION = {
     ("ตอน", "เย็น"): "ช่วงเย็น",
 }
 
+# Date dictionaries (checked in this order by parse_thai_date)
+THAI_RELATIVE_DATES = {
+    'วันนี้': 0,
+    'พรุ่งนี้': 1,
+    'มะรืนนี้': 2,
+    'วันถัดไป': 2,
+    'เ มื่อวาน': -1,
+    'เมื่อวานนี้': -1,
+    'เมื่อวานซืน': -2,
+    'วานนี้': -1,
+}
+
+THAI_MONTHS = {
+    'มกราคม': 1, 'ม.ค.': 1, 'กุมภาพันธ์': 2, 'ก.พ.': 2,
+    'มีนาคม': 3, 'มี.ค.': 3, 'เมษายน': 4, 'เม.ย.': 4,
+    'พฤษภาคม': 5, 'พ.ค.': 5, 'มิถุนายน': 6, 'มิ.ย.': 6,
+    'กรกฎาคม': 7, 'ก.ค.': 7, 'สิงหาคม': 8, 'ส.ค.': 8,
+    'กันยายน': 9, 'ก.ย.': 9, 'ตุลาคม': 10, 'ต.ค.': 10,
+    'พฤศจิกายน': 11, 'พ.ย.': 11, 'ธันวาคม': 12, 'ธ.ค.': 12,
+}
+
+THAI_WEEKDAYS = {
+    'จันทร์': 0, 'อังคาร': 1, 'พุธ': 2, 'พฤหัสบดี': 3,
+    'พฤหัส': 3, 'ศุกร์': 4, 'เสาร์': 5, 'อาทิตย์': 6,
+}
+
+# =========================
+# Precompiled Patterns
+# =========================
+
+_WS_RE = re.compile(r'\s+')
+_NUM_RE = re.compile(r'\d+')
+_TIME_RE = re.compile(r'(\d{1,2})[:.](\d{2})')
+
+_RELATIVE_DATE_RE = _compile_alternation(THAI_RELATIVE_DATES)
+_RELATIVE_DATE_RANK = _rank(THAI_RELATIVE_DATES)
+_MONTH_RE = _compile_alternation(THAI_MONTHS)
+_MONTH_RANK = _rank(THAI_MONTHS)
+_WEEKDAY_RE = _compile_alternation(THAI_WEEKDAYS)
+_WEEKDAY_RANK = _rank(THAI_WEEKDAYS)
+
+# Expanded Thai titles and roles
+_PERSON_TITLES = [
+    'รศ\\.ดร\\.', 'รศ\\.', 'ผศ\\.ดร\\.', 'ผศ\\.', 'ดร\\.', 'พญ\\.', 'นพ\\.',
+    'อาจารย์', 'คุณ', 'นาย', 'นางสาว', 'นาง', 'น\\.ส\\.', 
+    'ท่าน', 'พี่', 'เพื่อน'
+]
+
+_PERSON_ROLES = [
+    'ผอ\\.', 'ผู้อำนวยการ', 'ประธาน', 'เลขานุการ', 'นศ\\.', 'นักศึกษา'
+]
+
+_PERSON_PATTERNS = [re.compile(pattern) for pattern in [
+    # Full names: FirstName LastName (both must be Thai, 2+ chars each)
+    r'([ก-ฮ]{2,15})\s+([ก-ฮ]{2,20})(?=\s|$|ที่|ตอน|เวลา)',
+    
+    # Title + Full Name (e.g., "รศ.ดร. ศิรวิชญ์")
+    rf'(?:{"|".join(_PERSON_TITLES)})\s+([ก-ฮ][ก-ฮะ-ูเ-ไ์่้๊๋ํ]{{2,25}})(?:\s+([ก-ฮ]{{2,20}}))?(?=\s|$|ที่|ตอน)',
+    
+    # Role + name (e.g., "ผอ. สมชัย")
+    rf'(?:{"|".join(_PERSON_ROLES)})\s+([ก-ฮ][ก-ฮะ-ูเ-ไ์่้๊๋ํ]{{2,20}})(?=\s|$|ที่)',
+    
+    # "กับ" + name/nickname
+    r'กับ\s+([ก-ฮ][ก-ฮะ-ูเ-ไ์่้๊๋ํ]{1,20})(?=\s|$|ที่|และ)',
+    
+    # Verbs + person (พบ, เจอ, นัด, etc.)
+    r'(?:พบ|เจอ|นัด|หา|ติดต่อ)\s+([ก-ฮ][ก-ฮะ-ูเ-ไ์่้๊๋ํ]{1,20})(?=\s|$|ที่)',
+    
+    # Group/department descriptors (e.g., "อาจารย์สาขาวิชาวิทยาการคอมฯ")
+    r'(อาจารย์(?:สาขา)?(?:วิชา)?[ก-ฮะ-ูเ-ไ์่้๊๋ํฯ\s]{3,40})(?=\s|$|ที่|ตอน|เวลา|วัน)',
+    r'(นักศึกษา[ก-ฮะ-ูเ-ไ์่้๊๋ํ\s]{0,20})(?=\s|$|ที่)',
+]]
+
+# Exclusion filters for pattern-based names
+_EXCLUDED_NAMES = frozenset({
+    'วัน', 'เวลา', 'ที่', 'ตอน', 'เดือน', 'ปี', 'ประชุม',
+    'ม.ค.', 'ก.พ.', 'มี.ค.', 'เม.ย.', 'พ.ค.', 'มิ.ย.',
+    'ก.ค.', 'ส.ค.', 'ก.ย.', 'ต.ค.', 'พ.ย.', 'ธ.ค.',
+})
+
+# Vowel/tone marks that can't start a name (a match split mid-syllable)
+_LEADING_TONEMARKS = frozenset(['์', 'ิ', 'ี', 'ึ', 'ื', 'ุ', 'ู', '่', '้', '๊', '๋'])
+
+# "กับ" + generic person term
+_GENERIC_PERSON_RE = re.compile(r'กับ\s*(เพื่อน|แฟน|พี่|น้อง|พ่อ|แม่|ลูก|สามี|ภรรยา|เจ้านาย|หัวหน้า|ทีม|เพื่อนร่วมงาน|คนรัก|แฟนสาว|แฟนหนุ่ม)')
+# Generic person + action verbs (พบ, เจอ, etc.)
+_PERSON_ACTION_RE = re.compile(r'(เพื่อน|แฟน|พี่|น้อง)\s*(?:ไป|มา|พบ|เจอ|นัด)')
+
+# List of common activity keywords
+_ACTIVITY_KEYWORDS = [
+    # Meetings & work
+    'ประชุม', 'meeting', 'นัด', 'เจอ', 'พบ',
+    'เรียน', 'สอบ', 'นำเสนอ', 'presentation',
+    'สัมมนา', 'workshop', 'ส่งงาน', 'รายงาน',
+    
+    # Food & dining
+    'กินข้าว', 'กินอาหาร', 'ทานข้าว', 'ทานอาหาร',
+    'อาหาร', 'มื้อ', 'เลี้ยง', 'ดินเนอร์',
+    
+    # Social activities
+    'เที่ยว', 'ไปเที่ยว', 'ไปเดิน', 'ช้อปปิ้ง', 'ดูหนัง',
+    'ดูคอนเสิร์ต', 'งานปาร์ตี้', 'ปาร์ตี้',
+    
+    # Health & wellness
+    'หมอ', 'คลินิก', 'รักษา', 'ตรวจ', 'โรงพยาบาล',
+    
+    # Sports & fitness
+    'ออกกำลังกาย', 'ฟิตเนส', 'วิ่ง', 'ว่ายน้ำ', 'โยคะ',
+]
+_ACTIVITY_RE = _compile_alternation(_ACTIVITY_KEYWORDS)
+_ACTIVITY_RANK = _rank(_ACTIVITY_KEYWORDS)
+
+# Common location keywords - match more conservatively
+_LOCATION_KEYWORDS = [
+    'ตึก', 'อาคาร', 'ห้อง', 'ชั้น', 'ลาน',
+    'โรงพยาบาล', 'โรงเรียน', 'มหาวิทยาลัย',
+    'ศูนย์', 'คณะ', 'สำนักงาน'
+]
+_LOCATION_KEYWORD_RE = _compile_alternation(_LOCATION_KEYWORDS)
+_LOCATION_KEYWORD_PATTERNS = [
+    (keyword, re.compile(keyword + r'\s*([ก-ฮา-ูเ-ไ0-9\s]{0,20})(?:\s|ที่|ตอน|เวลา|$)'))
+    for keyword in _LOCATION_KEYWORDS
+]
+
+# Specific location patterns: (pattern, group index)
+_LOCATION_PATTERNS = [
+    (re.compile(r'ที่\s*([ก-ฮ][ก-ฮา-ูเ-ไ\s]{2,25})(?:ตอน|เวลา|ชั้น|$)'), 1),  # "ที่" + location
+    (re.compile(r'(zoom|google\s*meet|teams|online)'), 0),  # Online platforms (text is lowercased)
+]
+
+# Event separators (order matters!)
+_SEPARATORS = [
+    r'\s+และ\s+',      # Thai 'and'
+    r'\s+แล้ว\s+',     # Thai 'then'  
+    r'\s+แล้วก็\s+',   # Thai 'and then'
+    r'\s+พร้อม\s+',    # Thai 'along with'
+    r'\s+,\s*และ\s+',  # ', and'
+    r'\s+;\s*',        # semicolon
+    r'\s+/\s+',        # slash separator
+    r'\s*,\s+(?=.{10,})', # comma (but only if followed by substantial text)
+    r'\s+[Aa][Nn][Dd]\s+',      # English 'and' (any case, without IGNORECASE)
+    r'\s+[Tt][Hh][Ee][Nn]\s+',  # English 'then'
+]
+# Non-capturing, so re.split returns only the segments
+_SPLIT_RE = re.compile('|'.join(f'(?:{sep})' for sep in _SEPARATORS))
+
 
 def load_ner_model(model_path: str = "./my_ner_model"):
     """
@@ -152,23 +340,61 @@ def load_ner_model(model_path: str = "./my_ner_model"):
     if _nlp_model is not None:
         return _nlp_model
     
-    try:
-        _nlp_model = spacy.load(model_path)
-        print(f"✓ Loaded model from {model_path}")
-    except OSError:
-        print(f"⚠ Model not found at {model_path}, creating blank model")
-        _nlp_model = spacy.blank("th")
-        ner = _nlp_model.add_pipe("ner")
-        for label in ["DATE", "TIME", "ACTIVITY", "EVENT", "PERSON", "LOCATION"]:
-            ner.add_label(label)
+    # Callers arriving during a (background) load wait for it instead of loading again
+    with _model_lock:
+        if _nlp_model is not None:
+            return _nlp_model
+        
+        # Run on the GPU when one is available (no-op on CPU-only installs)
+        try:
+            spacy.prefer_gpu()
+        except Exception:
+            pass
+        
+        try:
+            _nlp_model = spacy.load(model_path, exclude=UNUSED_PIPES)
+            print(f"✓ Loaded model from {model_path}")
+        except OSError:
+            print(f"⚠ Model not found at {model_path}, creating blank model")
+            nlp = spacy.blank("th")
+            ner = nlp.add_pipe("ner")
+            for label in ["DATE", "TIME", "ACTIVITY", "EVENT", "PERSON", "LOCATION"]:
+                ner.add_label(label)
+            _nlp_model = nlp
     
     return _nlp_model
 
 
+def preload_ner_model(model_path: str = "./my_ner_model") -> Future:
+    """
+    Start loading the NER model in a background thread (once per process)
+    
+    Returns a Future resolving to the model. Anything calling
+    load_ner_model() meanwhile blocks until this load finishes.
+    """
+    global _model_future
+    
+    with _preload_lock:
+        if _model_future is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+            _model_future = executor.submit(load_ner_model, model_path)
+            executor.shutdown(wait=False)
+    
+    return _model_future
+
+
+@lru_cache(maxsize=4096)
 def normalize_thai_text(text: str) -> str:
     """
     Normalize Thai text using pythainlp and custom dictionaries
     Applies: Unicode normalization, slang normalization, loanword conversion
+    
+    Clock times take precedence over the period words around them:
+    
+    >>> normalize_thai_text('ประชุมตอนบ่ายสอง')
+    'ประชุมตอน14:00'
+    >>> normalize_thai_text('ตอนบ่ายโมง')
+    'ตอน13:00'
     """
     # Step 1: Basic unicode normalization
     try:
@@ -179,16 +405,14 @@ def normalize_thai_text(text: str) -> str:
     # Step 2: Lowercase for matching
     text_lower = text.lower()
     
-    # Step 3: Apply loanword dictionary (case-insensitive)
-    for loanword, thai_word in LOANWORD_DICT.items():
-        text_lower = text_lower.replace(loanword.lower(), thai_word)
-    
-    # Step 4: Apply slang dictionary
-    for slang, formal in SLANG_DICT.items():
-        text_lower = text_lower.replace(slang, formal)
+    # Step 3: Apply loanword and slang dictionaries (clock times first,
+    # then the rest; longest match wins within each pass)
+    replace = lambda m: _NORMALIZE_MAP[m.group(0)]
+    text_lower = _NORMALIZE_TIME_RE.sub(replace, text_lower)
+    text_lower = _NORMALIZE_RE.sub(replace, text_lower)
     
-    # Step 5: Whitespace cleanup
-    text_lower = re.sub(r'\s+', ' ', text_lower).strip()
+    # Step 4: Whitespace cleanup
+    text_lower = _WS_RE.sub(' ', text_lower).strip()
     
     return text_lower
 
@@ -209,80 +433,62 @@ def parse_thai_date(date_str: str, reference_date: Optional[datetime] = None) ->
     if reference_date is None:
         reference_date = get_current_datetime()
     
-    date_str = date_str.strip().lower()
+    # Only the reference day matters, so results are cached per (text, day)
+    return _parse_thai_date_cached(date_str.strip().lower(), reference_date.date())
+
+
+@lru_cache(maxsize=4096)
+def _parse_thai_date_cached(date_str: str, reference_day: date) -> Optional[str]:
+    """Cached body of parse_thai_date (date_str already stripped and lowercased)"""
+    reference_date = TZ.localize(datetime.combine(reference_day, datetime.min.time()))
     
     # Thai relative dates
-    thai_relative_dates = {
-        'วันนี้': 0,
-        'พรุ่งนี้': 1,
-        'มะรืนนี้': 2,
-        'วันถัดไป': 2,
-        'เ มื่อวาน': -1,
-        'เมื่อวานนี้': -1,
-        'เมื่อวานซืน': -2,
-        'วานนี้': -1,
-    }
-    
-    for thai_word, days in thai_relative_dates.items():
-        if thai_word in date_str:
-            target_date = reference_date + timedelta(days=days)
-            return target_date.strftime('%Y-%m-%d')
-    
-    # Thai months
-    thai_months = {
-        'มกราคม': 1, 'ม.ค.': 1, 'กุมภาพันธ์': 2, 'ก.พ.': 2,
-        'มีนาคม': 3, 'มี.ค.': 3, 'เมษายน': 4, 'เม.ย.': 4,
-        'พฤษภาคม': 5, 'พ.ค.': 5, 'มิถุนายน': 6, 'มิ.ย.': 6,
-        'กรกฎาคม': 7, 'ก.ค.': 7, 'สิงหาคม': 8, 'ส.ค.': 8,
-        'กันยายน': 9, 'ก.ย.': 9, 'ตุลาคม': 10, 'ต.ค.': 10,
-        'พฤศจิกายน': 11, 'พ.ย.': 11, 'ธันวาคม': 12, 'ธ.ค.': 12,
-    }
-    
-    # Extract all numbers
-    numbers = re.findall(r'\d+', date_str)
+    thai_word = _first_keyword(_RELATIVE_DATE_RE, _RELATIVE_DATE_RANK, date_str)
+    if thai_word:
+        target_date = reference_date + timedelta(days=THAI_RELATIVE_DATES[thai_word])
+        return target_date.strftime('%Y-%m-%d')
     
     # Try to parse with month (higher priority than weekday alone)
-    for thai_month, month_num in thai_months.items():
-        if thai_month in date_str:
-            day = int(numbers[0]) if numbers else 1
-            year = reference_date.year
-            
-            # Check if year is also specified (2-digit or 4-digit)
-            if len(numbers) >= 2:
-                year_candidate = int(numbers[1])
-                # Handle 2-digit year (assume 2500+ for Buddhist era, 20xx for Christian era)
-                if year_candidate < 100:
-                    if year_candidate >= 50:
-                        year = 2000 + year_candidate
-                    else:
-                        year = 2500 + year_candidate  # Buddhist era
-                elif year_candidate > 2500:  # Buddhist year
-                    year = year_candidate - 543
+    month_words = _MONTH_RE.findall(date_str)
+    if month_words:
+        # Extract all numbers (day and year don't depend on which month matched)
+        numbers = _NUM_RE.findall(date_str)
+        day = int(numbers[0]) if numbers else 1
+        year = reference_date.year
+        
+        # Check if year is also specified (2-digit or 4-digit)
+        if len(numbers) >= 2:
+            year_candidate = int(numbers[1])
+            # Handle 2-digit year (assume 2500+ for Buddhist era, 20xx for Christian era)
+            if year_candidate < 100:
+                if year_candidate >= 50:
+                    year = 2000 + year_candidate
                 else:
-                    year = year_candidate
-            
-            try:
-                target_date = datetime(year, month_num, day, tzinfo=TZ)
-                if target_date < reference_date:
-                    target_date = datetime(year + 1, month_num, day, tzinfo=TZ)
-                return target_date.strftime('%Y-%m-%d')
-            except ValueError:
-                pass
+                    year = 2500 + year_candidate  # Buddhist era
+            elif year_candidate > 2500:  # Buddhist year
+                year = year_candidate - 543
+            else:
+                year = year_candidate
+    
+    for thai_month in sorted(set(month_words), key=_MONTH_RANK.__getitem__):
+        month_num = THAI_MONTHS[thai_month]
+        try:
+            target_date = datetime(year, month_num, day, tzinfo=TZ)
+            if target_date < reference_date:
+                target_date = datetime(year + 1, month_num, day, tzinfo=TZ)
+            return target_date.strftime('%Y-%m-%d')
+        except ValueError:
+            pass
     
     # Thai weekdays (fallback if no month specified)
-    thai_weekdays = {
-        'จันทร์': 0, 'อังคาร': 1, 'พุธ': 2, 'พฤหัสบดี': 3,
-        'พฤหัส': 3, 'ศุกร์': 4, 'เสาร์': 5, 'อาทิตย์': 6,
-    }
-    
-    for thai_day, weekday in thai_weekdays.items():
-        if thai_day in date_str:
-            current_weekday = reference_date.weekday()
-            days_ahead = weekday - current_weekday
-            if days_ahead <= 0:
-                days_ahead += 7
-            target_date = reference_date + timedelta(days=days_ahead)
-            return target_date.strftime('%Y-%m-%d')
+    thai_day = _first_keyword(_WEEKDAY_RE, _WEEKDAY_RANK, date_str)
+    if thai_day:
+        current_weekday = reference_date.weekday()
+        days_ahead = THAI_WEEKDAYS[thai_day] - current_weekday
+        if days_ahead <= 0:
+            days_ahead += 7
+        target_date = reference_date + timedelta(days=days_ahead)
+        return target_date.strftime('%Y-%m-%d')
     
     # Fallback to dateparser
     try:
@@ -299,6 +505,7 @@ def parse_thai_date(date_str: str, reference_date: Optional[datetime] = None) ->
     return None
 
 
+@lru_cache(maxsize=4096)
 def parse_thai_time(time_str: str) -> Optional[str]:
     """
     Parse Thai time expressions to HH:MM format
@@ -322,14 +529,14 @@ def parse_thai_time(time_str: str) -> Optional[str]:
     
     # Find time patterns - support both : and . as separators
     # Pattern 1: HH:MM or HH.MM
-    time_pattern = re.findall(r'(\d{1,2})[:.](\d{2})', time_str)
+    time_pattern = _TIME_RE.findall(time_str)
     if time_pattern:
         hour, minute = int(time_pattern[0][0]), int(time_pattern[0][1])
         if 0 <= hour <= 23 and 0 <= minute <= 59:
             return f"{hour:02d}:{minute:02d}"
     
     # Extract numbers for non-formatted times
-    numbers = re.findall(r'\d+', time_str)
+    numbers = _NUM_RE.findall(time_str)
     
     hour = 0
     minute = 0
@@ -384,29 +591,11 @@ def split_by_separators(text: str) -> List[str]:
     if not text:
         return []
     
-    # Define separator patterns (order matters!)
-    separators = [
-        r'\s+และ\s+',      # Thai 'and'
-        r'\s+แล้ว\s+',     # Thai 'then'  
-        r'\s+แล้วก็\s+',   # Thai 'and then'
-        r'\s+พร้อม\s+',    # Thai 'along with'
-        r'\s+,\s*และ\s+',  # ', and'
-        r'\s+;\s*',        # semicolon
-        r'\s+/\s+',        # slash separator
-        r'\s*,\s+(?=.{10,})', # comma (but only if followed by substantial text)
-        r'\s+and\s+',      # English 'and'
-        r'\s+then\s+',     # English 'then'
-    ]
-    
-    # Combine all separators into one pattern
-    combined_pattern = '|'.join(f'({sep})' for sep in separators)
-    
     # Split text
-    segments = re.split(combined_pattern, text, flags=re.IGNORECASE)
+    segments = _SPLIT_RE.split(text)
     
-    # Filter out the separator matches themselves and empty strings
-    segments = [seg.strip() for i, seg in enumerate(segments) 
-                if i % 2 == 0 and seg and seg.strip()]
+    # Filter out empty strings
+    segments = [seg.strip() for seg in segments if seg and seg.strip()]
     
     return segments if segments else [text]
 
@@ -422,34 +611,84 @@ def extract_multiple_events(text: str, nlp_model=None) -> List[Dict[str, any]]:
             {date: '2026-02-11', time: None, description: 'ส่งเอกสาร', ...}
         ]
     """
+    return list(iter_multiple_events(text, nlp_model))
+
+
+def iter_multiple_events(text: str, nlp_model=None) -> Iterator[Dict[str, any]]:
+    """
+    Generator version of extract_multiple_events
+    
+    Yields each event's slots as soon as its segment has been processed,
+    so callers can display events while the rest are still being parsed.
+    """
     # Split into segments
     segments = split_by_separators(text)
     
+    # Run NER over all segments in one batch
+    docs = _parse_segments(segments, nlp_model)
+    
     # Process each segment
-    events = []
-    for segment in segments:
-        slots = extract_slots(segment, nlp_model)
-        
-        # Only add if it has at least a description or date
+    found_event = False
+    for segment, doc in zip(segments, docs):
+        slots = extract_slots(segment, nlp_model, doc=doc)
+    
+        # Only yield if it has at least a description or date
         if slots.get('description') or slots.get('date'):
             # Add original segment as raw_text
             slots['raw_text'] = segment
-            events.append(slots)
+            found_event = True
+            yield slots
+    
+    # If no events extracted, yield single event from full text
+    if not found_event:
+        yield extract_slots(text, nlp_model)
+
+
+def _parse_segments(segments: List[str], nlp_model=None) -> List:
+    """
+    Parse the normalized segments with a single nlp.pipe call
     
-    # If no events extracted, return single event from full text
-    if not events:
-        return [extract_slots(text, nlp_model)]
+    Returns one Doc per segment, or all None if the model can't run
+    (extract_slots then falls back to parsing each segment itself).
+    """
+    if nlp_model is None:
+        nlp_model = load_ner_model()
     
-    return events
+    try:
+        return list(nlp_model.pipe((normalize_thai_text(segment) for segment in segments), batch_size=32))
+    except Exception:
+        return [None] * len(segments)
+
+
+def _iter_person_names(text: str) -> Iterator[str]:
+    """
+    Lazily yield pattern-based person names, in pattern order, already filtered
+    
+    Patterns are only scanned as far as the caller consumes names.
+    """
+    for pattern in _PERSON_PATTERNS:
+        for match in pattern.finditer(text):
+            # Every captured group is a name part (e.g., first name + last name)
+            for part in match.groups():
+                if not part:
+                    continue
+                name = part.strip()
+                if (name not in _EXCLUDED_NAMES
+                        and len(name) >= 2  # Min 2 chars
+                        and len(name) <= 40  # Max 40 chars (for group names)
+                        and name[0] not in _LEADING_TONEMARKS
+                        and '.' not in name):  # Exclude abbreviations with dots
+                    yield name
 
 
-def extract_slots(text: str, nlp_model=None) -> Dict[str, any]:
+def extract_slots(text: str, nlp_model=None, doc=None) -> Dict[str, any]:
     """
     Extract calendar event slots using HYBRID approach:
     1. Rule-based extraction for DATE and TIME (always works)
     2. NER for ACTIVITY, PERSON, LOCATION (if model is trained)
     
     This ensures basic functionality even without a trained model!
+    Pass `doc` to reuse a spaCy Doc already parsed from the normalized text.
     """
     # Normalize text first
     normalized_text = normalize_thai_text(text)
@@ -477,9 +716,15 @@ def extract_slots(text: str, nlp_model=None) -> Dict[str, any]:
     
     # STEP 3: Try NER for ACTIVITY, PERSON, LOCATION (if model available)
     try:
-        entities = extract_entities_with_pos(normalized_text, nlp_model)
+        if doc is None:
+            if nlp_model is None:
+                nlp_model = load_ner_model()
+            doc = nlp_model(normalized_text)
         
-        for ent_text, label, pos in entities:
+        # Classify entities straight off the doc (POS of each entity's first token)
+        for ent in doc.ents:
+            ent_text, label, pos = ent.text, ent.label_, ent[0].pos_
+            
             # Only use NER for activity, person, location
             # (Date/time already handled by rules)
             if label in ['ACTIVITY', 'EVENT'] and pos in ['VERB', 'NOUN', 'PROPN', 'UNKNOWN']:
@@ -499,165 +744,61 @@ def extract_slots(text: str, nlp_model=None) -> Dict[str, any]:
     
     # STEP 4: Fallback - pattern-based extraction for person and location
     if not slots['description']:
-        # List of common activity keywords
-        activity_keywords = [
-            # Meetings & work
-            'ประชุม', 'meeting', 'นัด', 'เจอ', 'พบ',
-            'เรียน', 'สอบ', 'นำเสนอ', 'presentation',
-            'สัมมนา', 'workshop', 'ส่งงาน', 'รายงาน',
-            
-            # Food & dining
-            'กินข้าว', 'กินอาหาร', 'ทานข้าว', 'ทานอาหาร',
-            'อาหาร', 'มื้อ', 'เลี้ยง', 'ดินเนอร์',
-            
-            # Social activities
-            'เที่ยว', 'ไปเที่ยว', 'ไปเดิน', 'ช้อปปิ้ง', 'ดูหนัง',
-            'ดูคอนเสิร์ต', 'งานปาร์ตี้', 'ปาร์ตี้',
-            
-            # Health & wellness
-            'หมอ', 'คลินิก', 'รักษา', 'ตรวจ', 'โรงพยาบาล',
-            
-            # Sports & fitness
-            'ออกกำลังกาย', 'ฟิตเนส', 'วิ่ง', 'ว่ายน้ำ', 'โยคะ',
-        ]
-        
-        for keyword in activity_keywords:
-            if keyword in normalized_text:
-                slots['description'] = keyword
-                break
+        # One scan for all keywords; earlier list entries take priority
+        slots['description'] = _first_keyword(_ACTIVITY_RE, _ACTIVITY_RANK, normalized_text)
     
     # STEP 5: Pattern-based PERSON detection
     if not slots['attendees']:
-        found_names = []
-        
-        # Expanded Thai titles and roles
-        titles = [
-            'รศ\\.ดร\\.', 'รศ\\.', 'ผศ\\.ดร\\.', 'ผศ\\.', 'ดร\\.', 'พญ\\.', 'นพ\\.',
-            'อาจารย์', 'คุณ', 'นาย', 'นางสาว', 'นาง', 'น\\.ส\\.', 
-            'ท่าน', 'พี่', 'เพื่อน'
-        ]
-        
-        roles = [
-            'ผอ\\.', 'ผู้อำนวยการ', 'ประธาน', 'เลขานุการ', 'นศ\\.', 'นักศึกษา'
-        ]
-        
-        person_patterns = [
-            # Full names: FirstName LastName (both must be Thai, 2+ chars each)
-            r'([ก-ฮ]{2,15})\s+([ก-ฮ]{2,20})(?=\s|$|ที่|ตอน|เวลา)',
-            
-            # Title + Full Name (e.g., "รศ.ดร. ศิรวิชญ์")
-            rf'(?:{"|".join(titles)})\s+([ก-ฮ][ก-ฮะ-ูเ-ไ์่้๊๋ํ]{{2,25}})(?:\s+([ก-ฮ]{{2,20}}))?(?=\s|$|ที่|ตอน)',
-            
-            # Role + name (e.g., "ผอ. สมชัย")
-            rf'(?:{"|".join(roles)})\s+([ก-ฮ][ก-ฮะ-ูเ-ไ์่้๊๋ํ]{{2,20}})(?=\s|$|ที่)',
-            
-            # "กับ" + name/nickname
-            r'กับ\s+([ก-ฮ][ก-ฮะ-ูเ-ไ์่้๊๋ํ]{1,20})(?=\s|$|ที่|และ)',
-            
-            # Verbs + person (พบ, เจอ, นัด, etc.)
-            r'(?:พบ|เจอ|นัด|หา|ติดต่อ)\s+([ก-ฮ][ก-ฮะ-ูเ-ไ์่้๊๋ํ]{1,20})(?=\s|$|ที่)',
-            
-            # Group/department descriptors (e.g., "อาจารย์สาขาวิชาวิทยาการคอมฯ")
-            r'(อาจารย์(?:สาขา)?(?:วิชา)?[ก-ฮะ-ูเ-ไ์่้๊๋ํฯ\s]{3,40})(?=\s|$|ที่|ตอน|เวลา|วัน)',
-            r'(นักศึกษา[ก-ฮะ-ูเ-ไ์่้๊๋ํ\s]{0,20})(?=\s|$|ที่)',
-        ]
-        
-        for pattern in person_patterns:
-            matches = re.findall(pattern, normalized_text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    # Handle captured groups (e.g., first name + last name)
-                    name_parts = [m.strip() for m in match if m and m.strip()]
-                    if name_parts:
-                        found_names.extend(name_parts)
-                else:
-                    found_names.append(match.strip())
-        
-        # Exclusion filters
-        excluded = {
-            'วัน', 'เวลา', 'ที่', 'ตอน', 'เดือน', 'ปี', 'ประชุม',
-            'ม.ค.', 'ก.พ.', 'มี.ค.', 'เม.ย.', 'พ.ค.', 'มิ.ย.',
-            'ก.ค.', 'ส.ค.', 'ก.ย.', 'ต.ค.', 'พ.ย.', 'ธ.ค.',
-        }
+        # Remove duplicates while preserving order, and stop scanning
+        # once the first 2 distinct names are known (Max 2 names)
+        unique_names = {}
+        for name in _iter_person_names(normalized_text):
+            unique_names[name] = None
+            if len(unique_names) == 2:
+                break
         
-        if found_names:
-            # Filter and validate names
-            names = [
-                m.strip() for m in found_names
-                if m.strip() not in excluded
-                and len(m.strip()) >= 2  # Min 2 chars
-                and len(m.strip()) <= 40  # Max 40 chars (for group names)
-                and not m.strip()[0] in ['์', 'ิ', 'ี', 'ึ', 'ื', 'ุ', 'ู', '่', '้', '๊', '๋']
-                and '.' not in m  # Exclude abbreviations with dots
-            ]
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_names = []
-            for name in names:
-                if name not in seen and name:  # Also check not empty
-                    seen.add(name)
-                    unique_names.append(name)
-            
-            if unique_names:
-                slots['attendees'] = ', '.join(unique_names[:2])  # Max 2 names
+        slots['attendees'].extend(unique_names)
     
     # STEP 5.5: Pattern-based GENERIC PERSON detection (if no specific names found)
     if not slots['attendees']:
-        generic_people = []
-        
         # Pattern 1: "กับ" + generic person term
-        generic_person_pattern = r'กับ\s*(เพื่อน|แฟน|พี่|น้อง|พ่อ|แม่|ลูก|สามี|ภรรยา|เจ้านาย|หัวหน้า|ทีม|เพื่อนร่วมงาน|คนรัก|แฟนสาว|แฟนหนุ่ม)'
-        matches = re.findall(generic_person_pattern, normalized_text)
-        generic_people.extend(matches)
+        # (Remove duplicates while preserving order)
+        unique_people = list(dict.fromkeys(_GENERIC_PERSON_RE.findall(normalized_text)))
         
         # Pattern 2: generic person + action verbs (พบ, เจอ, etc.)
-        person_action_pattern = r'(เพื่อน|แฟน|พี่|น้อง)\s*(?:ไป|มา|พบ|เจอ|นัด)'
-        matches = re.findall(person_action_pattern, normalized_text)
-        generic_people.extend(matches)
+        # Only needed while fewer than 2 people were found
+        if len(unique_people) < 2:
+            unique_people = list(dict.fromkeys(unique_people + _PERSON_ACTION_RE.findall(normalized_text)))
         
-        if generic_people:
-            # Remove duplicates while preserving order
-            unique_people = list(dict.fromkeys(generic_people))
-            slots['attendees'] = ', '.join(unique_people[:2])  # Max 2
+        slots['attendees'].extend(unique_people[:2])  # Max 2
     
     # STEP 6: Pattern-based LOCATION detection  
     if not slots['location']:
-        # Common location keywords - match more conservatively
-        location_keywords = [
-            'ตึก', 'อาคาร', 'ห้อง', 'ชั้น', 'ลาน',
-            'โรงพยาบาล', 'โรงเรียน', 'มหาวิทยาลัย',
-            'ศูนย์', 'คณะ', 'สำนักงาน'
-        ]
-        
-        for keyword in location_keywords:
-            pattern = keyword + r'\s*([ก-ฮา-ูเ-ไ0-9\s]{0,20})(?:\s|ที่|ตอน|เวลา|$)'
-            match = re.search(pattern, normalized_text)
-            if match:
-                # Preserve spacing between keyword and content
-                content = match.group(1).strip()
-                if content:
-                    # Add space between keyword and number if missing
-                    if content and content[0].isdigit():
-                        location = keyword + ' ' + content
+        # Skip the per-keyword patterns when no keyword occurs at all
+        if _LOCATION_KEYWORD_RE.search(normalized_text):
+            for keyword, pattern in _LOCATION_KEYWORD_PATTERNS:
+                match = pattern.search(normalized_text)
+                if match:
+                    # Preserve spacing between keyword and content
+                    content = match.group(1).strip()
+                    if content:
+                        # Add space between keyword and number if missing
+                        if content and content[0].isdigit():
+                            location = keyword + ' ' + content
+                        else:
+                            location = keyword + content
                     else:
-                        location = keyword + content
-                else:
-                    location = keyword
-                
-                # Validate: should be 3-30 chars and not just the keyword
-                if 3 <= len(location) <= 30 and location != keyword:
-                    slots['location'] = location[:30]
-                    break
+                        location = keyword
+                    
+                    # Validate: should be 3-30 chars and not just the keyword
+                    if 3 <= len(location) <= 30 and location != keyword:
+                        slots['location'] = location[:30]
+                        break
         
         # Specific location patterns
         if not slots['location']:
-            location_patterns = [
-                (r'ที่\s*([ก-ฮ][ก-ฮา-ูเ-ไ\s]{2,25})(?:ตอน|เวลา|ชั้น|$)', 1),  # "ที่" + location
-                (r'(zoom|google\s*meet|teams|online)', 0),  # Online platforms
-            ]
-            
-            for pattern, group_idx in location_patterns:
-                match = re.search(pattern, normalized_text, re.IGNORECASE)
+            for pattern, group_idx in _LOCATION_PATTERNS:
+                match = pattern.search(normalized_text)
                 if match:
                     location_text = match.group(group_idx) if group_idx > 0 else match.group()
                     if any(word in location_text.lower() for word in ['zoom', 'meet', 'teams', 'online']):
@@ -666,13 +807,8 @@ def extract_slots(text: str, nlp_model=None) -> Dict[str, any]:
                         slots['location'] = location_text.strip()[:30]
                     break
     
-    # Convert attendees list to string (only if it's a list)
-    if slots['attendees']:
-        if isinstance(slots['attendees'], list):
-            slots['attendees'] = ', '.join(slots['attendees'])
-        # If it's already a string (from generic person detection), leave it as is
-    else:
-        slots['attendees'] = None
+    # Attendees are collected as a list throughout and joined once here
+    slots['attendees'] = ', '.join(slots['attendees']) if slots['attendees'] else None
     
     return slots
 
@@ -696,42 +832,174 @@ def create_event(slots: Dict[str, any], event_id: Optional[str] = None) -> Dict:
     return event
 
 
-def load_events(filepath: str = EVENTS_FILE) -> List[Dict]:
-    """Load events from JSON file"""
+def dump_events_json(events: List[Dict]) -> bytes:
+    """Serialize events to the events.json format (UTF-8, indented)"""
+    data = {'events': events}
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+# The event file is an append-only JSON Lines journal: one event per line,
+# a later line with the same id replaces it and {"id": ..., "deleted": true}
+# removes it. save_events rewrites (compacts) the whole journal, and
+# load_events does so by itself once stale lines far outnumber live events.
+
+# Replayed journals keyed by path: {filepath: ((mtime_ns, size), events)}
+_events_cache = {}
+
+# Compact once the journal has this many lines and over twice as many
+# lines as live events (superseded records and tombstones)
+COMPACT_MIN_LINES = 100
+
+# Journal paths already checked for a legacy events.json to import
+_legacy_checked = set()
+
+
+def _journal_line(record: Dict) -> bytes:
+    """Serialize one journal record as a single JSON line"""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n"
+
+
+def _append_events(records: List[Dict], filepath: str = EVENTS_FILE):
+    """
+    Append records to the journal with a single write
+    
+    A torn last line (interrupted append) is terminated first, so only
+    that line is lost and not the records appended after it:
+    
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'events.jsonl')
+    >>> with open(path, 'wb') as f:
+    ...     _ = f.write(b'{"id": "a"}\\n{"id": "tor')
+    >>> _ = add_event({'id': 'y'}, path)
+    >>> [event['id'] for event in load_events(path)]
+    ['a', 'y']
+    """
+    _import_legacy_events(filepath)
+    data = b''.join(_journal_line(record) for record in records)
+    with open(filepath, 'a+b') as f:
+        # Writes in append mode always go to the end; seek only to peek
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
+
+
+def _file_signature(filepath: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _legacy_events_path(filepath: str) -> str:
+    """events.json-style file the journal at filepath replaces"""
+    if filepath == EVENTS_FILE:
+        return LEGACY_EVENTS_FILE
+    return os.path.splitext(filepath)[0] + ".json"
+
+
+def _import_legacy_events(filepath: str):
+    """
+    One-time import of a legacy {"events": [...]} file into a new journal
+    
+    Only runs while the journal doesn't exist yet; the legacy file is left
+    untouched.
+    """
+    if filepath in _legacy_checked:
+        return
+    _legacy_checked.add(filepath)
+    
+    legacy_path = _legacy_events_path(filepath)
+    if legacy_path == filepath or os.path.exists(filepath):
+        return
+    try:
+        with open(legacy_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            return data.get('events', [])
     except (FileNotFoundError, json.JSONDecodeError):
+        return
+    
+    events = data.get('events', []) if isinstance(data, dict) else data
+    if isinstance(events, list) and events:
+        save_events(events, filepath)
+
+
+def load_events(filepath: str = EVENTS_FILE) -> List[Dict]:
+    """Load events by replaying the JSON Lines journal (cached until the file changes)"""
+    _import_legacy_events(filepath)
+    signature = _file_signature(filepath)
+    if signature is None:
         return []
+    
+    cached = _events_cache.get(filepath)
+    if cached is None or cached[0] != signature:
+        events, line_count = _replay_journal(filepath)
+        if line_count >= COMPACT_MIN_LINES and line_count > 2 * len(events):
+            save_events(events, filepath)  # Also refreshes the cache
+            cached = _events_cache[filepath]
+        else:
+            cached = (signature, events)
+            _events_cache[filepath] = cached
+    
+    # Copies, so callers can modify events without touching the cache
+    return [dict(event) for event in cached[1]]
 
 
-def save_events(events: List[Dict], filepath: str = EVENTS_FILE):
-    """Save events to JSON file"""
-    print(f"DEBUG: Saving {len(events)} events to {filepath}")  # Debug
+def _replay_journal(filepath: str) -> Tuple[List[Dict], int]:
+    """Read the journal and apply every record in order (returns events, line count)"""
+    events = {}
+    line_count = 0
     try:
-        data = {'events': events}
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"DEBUG: Successfully saved to {filepath}")  # Debug
-    except Exception as e:
-        print(f"DEBUG: Error saving events: {e}")  # Debug
-        raise
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                line_count += 1
+                try:
+                    record = orjson.loads(line) if orjson is not None else json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn line from an interrupted append
+                if record.get('deleted'):
+                    events.pop(record.get('id'), None)
+                else:
+                    events[record.get('id')] = record
+    except FileNotFoundError:
+        return [], 0
+    return list(events.values()), line_count
+
+
+def save_events(events: List[Dict], filepath: str = EVENTS_FILE):
+    """Rewrite the journal with exactly these events (temp file, then swapped in atomically)"""
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(b''.join(_journal_line(event) for event in events))
+    os.replace(tmp_path, filepath)
+    
+    # The file now holds exactly these events, no need to parse it again
+    _events_cache[filepath] = (_file_signature(filepath), [dict(event) for event in events])
 
 
 def add_event(event: Dict, filepath: str = EVENTS_FILE):
     """Add a new event to the file"""
-    events = load_events(filepath)
-    events.append(event)
-    save_events(events, filepath)
+    _append_events([event], filepath)
     return event
 
 
+def add_events_bulk(new_events: List[Dict], filepath: str = EVENTS_FILE):
+    """Add several events with a single write"""
+    _append_events(new_events, filepath)
+    return new_events
+
+
 def delete_event(event_id: str, filepath: str = EVENTS_FILE):
     """Delete an event by ID"""
-    events = load_events(filepath)
-    events = [e for e in events if e['id'] != event_id]
-    save_events(events, filepath)
+    _append_events([{'id': event_id, 'deleted': True}], filepath)
 
 
 def update_event(event_id: str, updated_data: Dict, filepath: str = EVENTS_FILE):
@@ -761,30 +1029,155 @@ def update_event(event_id: str, updated_data: Dict, filepath: str = EVENTS_FILE)
                 events[i]['raw_text'] = original_raw_text
             events[i]['updated_at'] = get_current_datetime().isoformat()
             
-            save_events(events, filepath)
+            _append_events([events[i]], filepath)
             return events[i]
     return None
 
 
+# =========================
+# SQLite Event Storage (per-session database used by the app)
+# =========================
+
+EVENT_COLUMNS = (
+    'id', 'date', 'time', 'description', 'attendees',
+    'location', 'raw_text', 'created_at', 'updated_at'
+)
+
+_INSERT_EVENT_SQL = (
+    f"INSERT OR REPLACE INTO events ({', '.join(EVENT_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in EVENT_COLUMNS)})"
+)
+
+
+def connect_events_db(db_path: str) -> sqlite3.Connection:
+    """
+    Open (or create) an SQLite events database
+
+    Uses WAL journaling so reads never block on writes, and an index on
+    `date` so calendar lookups are indexed range scans.
+    """
+    # Streamlit reruns a session's script on different threads
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS events (
+                id TEXT PRIMARY KEY,
+                date TEXT,
+                time TEXT,
+                description TEXT,
+                attendees TEXT,
+                location TEXT,
+                raw_text TEXT,
+                created_at TEXT,
+                updated_at TEXT
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_date ON events(date)")
+    return conn
+
+
+def _event_row(event: Dict) -> Tuple:
+    """Order an event dict's fields to match EVENT_COLUMNS"""
+    return tuple(event.get(column) for column in EVENT_COLUMNS)
+
+
+def db_load_events(conn: sqlite3.Connection) -> List[Dict]:
+    """Load all events from the database, sorted by date (undated last)"""
+    rows = conn.execute(
+        "SELECT * FROM events ORDER BY COALESCE(NULLIF(date, ''), '9999-99-99')"
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def fetch_events_for_month(conn: sqlite3.Connection, year: int, month: int) -> List[Dict]:
+    """Load events whose date falls in the given month, ordered by date and time"""
+    month_prefix = f"{year:04d}-{month:02d}-"
+    rows = conn.execute(
+        "SELECT * FROM events WHERE date BETWEEN ? AND ? ORDER BY date, time",
+        (month_prefix + "01", month_prefix + "31")
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def db_get_event(conn: sqlite3.Connection, event_id: str) -> Optional[Dict]:
+    """Load a single event by ID (None if not found)"""
+    row = conn.execute("SELECT * FROM events WHERE id = ?", (event_id,)).fetchone()
+    return dict(row) if row else None
+
+
+def db_add_event(conn: sqlite3.Connection, event: Dict) -> Dict:
+    """Insert an event, replacing any existing event with the same ID"""
+    with conn:
+        conn.execute(_INSERT_EVENT_SQL, _event_row(event))
+    return event
+
+
+def db_add_events(conn: sqlite3.Connection, events: List[Dict]) -> List[Dict]:
+    """Insert several events in a single transaction"""
+    with conn:
+        conn.executemany(_INSERT_EVENT_SQL, [_event_row(event) for event in events])
+    return events
+
+
+def db_delete_event(conn: sqlite3.Connection, event_id: str):
+    """Delete an event by ID"""
+    with conn:
+        conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+
+
+def db_update_event(conn: sqlite3.Connection, event_id: str, updated_data: Dict) -> Optional[Dict]:
+    """
+    Update an existing event by ID
+
+    The id, raw_text and created_at fields are preserved; updated_at is refreshed.
+
+    Returns:
+        The updated event, or None if no event has this ID
+    """
+    fields = {
+        k: v for k, v in updated_data.items()
+        if k in EVENT_COLUMNS and k not in ('id', 'raw_text', 'created_at')
+    }
+    fields['updated_at'] = get_current_datetime().isoformat()
+
+    assignments = ', '.join(f"{column} = ?" for column in fields)
+    with conn:
+        cursor = conn.execute(
+            f"UPDATE events SET {assignments} WHERE id = ?",
+            (*fields.values(), event_id)
+        )
+    if cursor.rowcount == 0:
+        return None
+
+    return db_get_event(conn, event_id)
+
+
+def db_clear_events(conn: sqlite3.Connection):
+    """Delete all events"""
+    with conn:
+        conn.execute("DELETE FROM events")
+
+
 def process_text_to_event(text: str, nlp_model=None, save_to_file: bool = False) -> Dict:
     """
     Complete pipeline: text → slots → validation → event
     
     Returns event dict with additional validation metadata:
     - 'is_valid': bool
-    - 'missing_fields': list of critical missing fields
+    - 'missing_fields': tuple of critical missing fields
     - 'auto_filled': dict of fields that were auto-filled
     """
-    from validation import validate_event_data, apply_safe_defaults
+    from validation import validate_and_fill
     
     # Extract slots
     slots = extract_slots(text, nlp_model)
     
-    # Validate and get safe defaults
-    is_valid, missing_fields, safe_defaults = validate_event_data(slots)
-    
-    # Apply safe defaults
-    slots_with_defaults = apply_safe_defaults(slots, safe_defaults)
+    # Validate and apply safe defaults
+    is_valid, missing_fields, safe_defaults, slots_with_defaults = validate_and_fill(slots)
     
     # Create event (without saving yet)
     event = create_event(slots_with_defaults)
@@ -792,7 +1185,7 @@ def process_text_to_event(text: str, nlp_model=None, save_to_file: bool = False)
     # Add validation metadata
     event['is_valid'] = is_valid
     event['missing_fields'] = missing_fields
-    event['auto_filled'] = safe_defaults
+    event['auto_filled'] = dict(safe_defaults)  # Plain dict, so the event stays JSON-serializable
     
     # Only save if explicitly requested AND validation passes
     if save_to_file and is_valid:
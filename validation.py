@@ -3,11 +3,82 @@ Validation utilities for event data
 Ensures data completeness and provides safe defaults
 """
 
-from typing import Dict, Tuple, List
-from datetime import datetime
+import sys
+from enum import IntFlag
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple, Sequence
 
+# Slot keys, interned so dict lookups can match on identity
+_FIELD_DESCRIPTION = sys.intern('description')
+_FIELD_DATE = sys.intern('date')
+_FIELD_TIME = sys.intern('time')
+_FIELD_LOCATION = sys.intern('location')
 
-def validate_event_data(slots: Dict) -> Tuple[bool, List[str], Dict]:
+# Safe defaults for non-critical fields
+DEFAULT_TIME = '09:00'
+DEFAULT_LOCATION = '-'
+
+# Questions asked for each missing field
+MISSING_FIELD_MESSAGES = {
+    'activity': 'กิจกรรมคืออะไรคะ? (เช่น ประชุม, เรียน, นัดหมาย)',
+    'date': 'วันไหนคะ? (เช่น พรุ่งนี้, วันจันทร์, 15 กุมภาพันธ์)',
+    'time': 'เวลาเท่าไหร่คะ? (เช่น 10 โมง, บ่าย 2 โมง)',
+}
+
+# Missing critical fields, indexed by (has_activity << 1) | has_date
+MISSING_FIELDS_TABLE = (
+    ('activity', 'date'),  # neither
+    ('activity',),         # date only
+    ('date',),             # activity only
+    (),                    # both
+)
+
+# Returned when nothing needs a default
+_EMPTY_DEFAULTS = MappingProxyType({})
+
+# Safe defaults, indexed by (has_time << 1) | has_location
+# (read-only views, so the same four can be shared by every call)
+SAFE_DEFAULTS_TABLE = (
+    MappingProxyType({_FIELD_TIME: DEFAULT_TIME, _FIELD_LOCATION: DEFAULT_LOCATION}),
+    MappingProxyType({_FIELD_TIME: DEFAULT_TIME}),
+    MappingProxyType({_FIELD_LOCATION: DEFAULT_LOCATION}),
+    _EMPTY_DEFAULTS,
+)
+
+
+class SlotState(IntFlag):
+    """Bits of the filled-slot state that indexes VALIDATION_TABLE"""
+    LOCATION = 1
+    TIME = 2
+    DATE = 4
+    DESCRIPTION = 8
+
+
+# Activity/date bits, shifted down to index MISSING_FIELDS_TABLE
+_CRITICAL_SHIFT = 2
+_CRITICAL_MASK = SlotState.DESCRIPTION | SlotState.DATE
+_OPTIONAL_MASK = SlotState.TIME | SlotState.LOCATION
+
+
+def _build_validation_table() -> Tuple[Tuple[bool, Tuple[str, ...], Mapping[str, str]], ...]:
+    """Precompute validate_event_data's result for all 16 filled/empty combinations"""
+    return tuple(
+        (
+            bool(state & _CRITICAL_MASK),  # Minimum requirement: MUST have activity OR date
+            MISSING_FIELDS_TABLE[(state & _CRITICAL_MASK) >> _CRITICAL_SHIFT],
+            SAFE_DEFAULTS_TABLE[state & _OPTIONAL_MASK],
+        )
+        for state in range(1 << len(SlotState))
+    )
+
+
+# validate_event_data results, indexed by the SlotState bits of the
+# filled fields
+VALIDATION_TABLE = _build_validation_table()
+
+
+def validate_event_data(slots: Dict) -> Tuple[bool, Tuple[str, ...], Mapping[str, str]]:
     """
     Validate extracted event slots
     
@@ -17,57 +88,100 @@ def validate_event_data(slots: Dict) -> Tuple[bool, List[str], Dict]:
     Returns:
         (is_valid, missing_fields, safe_defaults)
         - is_valid: True if minimum requirements met
-        - missing_fields: List of critical missing fields to ask user
-        - safe_defaults: Dictionary of safe auto-fill values
+        - missing_fields: Tuple of critical missing fields to ask user
+        - safe_defaults: Read-only mapping of safe auto-fill values
+    """
+    # Which fields are filled, packed into one index (each looked up once);
+    # the literals are the SlotState bits, inlined to skip enum arithmetic.
+    # This is the only place the bit layout is computed per call.
+    get = slots.get
+    state = (
+        (8 if get(_FIELD_DESCRIPTION) else 0)
+        | (4 if get(_FIELD_DATE) else 0)
+        | (2 if get(_FIELD_TIME) else 0)
+        | (1 if get(_FIELD_LOCATION) else 0)
+    )
+    
+    return VALIDATION_TABLE[state]
+
+
+def validate_events(slots_list: Iterable[Dict]) -> List[Tuple[bool, Tuple[str, ...], Mapping[str, str]]]:
     """
-    missing_critical = []
-    safe_defaults = {}
+    validate_event_data for many candidate slots at once
     
-    # Critical field checks
-    has_activity = bool(slots.get('description'))
-    has_date = bool(slots.get('date'))
+    Args:
+        slots_list: Slots dictionaries, e.g. one per parsed segment
     
-    # Minimum requirement: MUST have activity OR date
-    is_valid = has_activity or has_date
+    Returns:
+        List of (is_valid, missing_fields, safe_defaults), in input order
+    """
+    # map drives the loop in C; the state packing stays in validate_event_data
+    return list(map(validate_event_data, slots_list))
+
+
+def validate_and_fill(slots: Dict) -> Tuple[bool, Tuple[str, ...], Mapping[str, str], Dict]:
+    """
+    Validate slots and apply the safe defaults in one step
+    
+    Same as validate_event_data followed by apply_safe_defaults, but the
+    defaults are merged into a single copy of the slots.
+    
+    Args:
+        slots: Dictionary with date, time, description, attendees, location
     
-    # Track what's missing
-    if not has_activity:
-        missing_critical.append('activity')
+    Returns:
+        (is_valid, missing_fields, safe_defaults, filled_slots)
+        - filled_slots: Copy of slots with the safe defaults applied
+    """
+    is_valid, missing_critical, safe_defaults = validate_event_data(slots)
     
-    if not has_date:
-        missing_critical.append('date')
+    # safe_defaults only holds fields that are empty in slots
+    filled_slots = {**slots, **safe_defaults}
+    
+    return is_valid, missing_critical, safe_defaults, filled_slots
+
+
+def validate_and_saveable(slots: Dict) -> Tuple[bool, Tuple[str, ...], Mapping[str, str], bool]:
+    """
+    Validate slots and check is_event_saveable from the same lookups
     
-    # Safe defaults (only for non-critical fields)
-    if not slots.get('time'):
-        safe_defaults['time'] = '09:00'
+    Args:
+        slots: Dictionary with date, time, description, attendees, location
     
-    if not slots.get('location'):
-        safe_defaults['location'] = '-'
+    Returns:
+        (is_valid, missing_fields, safe_defaults, saveable)
+        - saveable: Same as is_event_saveable(slots)
+    """
+    is_valid, missing_critical, safe_defaults = validate_event_data(slots)
     
-    return is_valid, missing_critical, safe_defaults
+    # missing_fields only ever names activity and date, the two fields
+    # is_event_saveable requires, so saveable means nothing is missing
+    return is_valid, missing_critical, safe_defaults, not missing_critical
 
 
-def apply_safe_defaults(slots: Dict, defaults: Dict) -> Dict:
+def apply_safe_defaults(slots: Dict, defaults: Mapping[str, str]) -> Dict:
     """
     Apply safe default values to slots
     
     Args:
         slots: Original slots dictionary
-        defaults: Dictionary of default values to apply
+        defaults: Mapping of default values to apply (not modified)
     
     Returns:
-        Updated slots with defaults applied
+        Updated slots with defaults applied (the original slots
+        object itself if no default was needed)
     """
-    updated_slots = slots.copy()
+    get = slots.get
+    missing_defaults = {field: value for field, value in defaults.items() if not get(field)}
     
-    for field, default_value in defaults.items():
-        if not updated_slots.get(field):
-            updated_slots[field] = default_value
+    # No copy needed when nothing changes
+    if not missing_defaults:
+        return slots
     
-    return updated_slots
+    return {**slots, **missing_defaults}
 
 
-def format_missing_fields_message(missing_fields: List[str]) -> str:
+def format_missing_fields_message(missing_fields: Sequence[str]) -> str:
     """
     Create user-friendly message for missing fields
     Ask for ONE field at a time to avoid confusion
@@ -81,15 +195,14 @@ def format_missing_fields_message(missing_fields: List[str]) -> str:
     if not missing_fields:
         return ""
     
-    messages = {
-        'activity': 'กิจกรรมคืออะไรคะ? (เช่น ประชุม, เรียน, นัดหมาย)',
-        'date': 'วันไหนคะ? (เช่น พรุ่งนี้, วันจันทร์, 15 กุมภาพันธ์)',
-        'time': 'เวลาเท่าไหร่คะ? (เช่น 10 โมง, บ่าย 2 โมง)',
-    }
-    
     # Return only the FIRST missing field
-    first_missing = missing_fields[0]
-    return messages.get(first_missing, f'{first_missing}?')
+    return _missing_field_message(missing_fields[0])
+
+
+@lru_cache(maxsize=8)
+def _missing_field_message(field: str) -> str:
+    """Question for one missing field (only a handful of distinct fields exist)"""
+    return MISSING_FIELD_MESSAGES.get(field, f'{field}?')
 
 
 def is_event_saveable(slots: Dict) -> bool:
@@ -103,8 +216,8 @@ def is_event_saveable(slots: Dict) -> bool:
     Returns:
         True if event can be saved, False otherwise
     """
-    has_activity = bool(slots.get('description'))
-    has_date = bool(slots.get('date'))
-    
-    # CRITICAL: Do not save if both are missing
-    return has_activity and has_date
+    # CRITICAL: Do not save unless both are present
+    # (date first: it is the field most often missing, so the
+    # description lookup is usually skipped)
+    get = slots.get
+    return bool(get(_FIELD_DATE) and get(_FIELD_DESCRIPTION))